@@ -6,4 +6,4 @@ from haystack_experimental.chat_message_stores.in_memory import InMemoryChatMess
 from haystack_experimental.chat_message_stores.distributed import DistributedChatMessageStore
 
 
-_all_ = ["InMemoryChatMessageStore", "DistributedChatMessageStore"]
+__all__ = ["InMemoryChatMessageStore", "DistributedChatMessageStore"]
@@ -2,45 +2,324 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
+import hashlib
+import json
+import random
+import threading
 import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from haystack import Document
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
 from haystack import default_from_dict, default_to_dict, logging
 from haystack.dataclasses import ChatMessage
 
 from haystack_experimental.chat_message_stores.types import ChatMessageStore
 
-from haystack.components.retrievers import FilterRetriever
+if TYPE_CHECKING:
+    from haystack.components.retrievers import FilterRetriever
 
 logger = logging.getLogger(__name__)
 
+# Upper bound of the random delay applied before each concurrent embedder call, to avoid bursts of
+# simultaneous requests hitting rate-limited embedding APIs.
+_DISPATCH_JITTER_S = 0.05
+
+# Filter field identifying the user a store instance writes messages for.
+_USER_ID_FIELD = "meta.user_id"
+
+# Maximum number of distinct filters whose `retrieve` results are cached per store instance.
+_RETRIEVE_CACHE_SIZE = 128
+
+# Warmed-up embedders shared by all store instances, keyed by embedder type and configuration.
+# This way stores that are created per request reuse an already loaded model instead of loading it again.
+# Embedders are only kept while they are still referenced elsewhere, e.g. by a store or by the caller of `preload`.
+_EMBEDDER_CACHE: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
+# Warm-ups in progress. Concurrent preloads of the same embedder wait for the running warm-up instead of loading
+# the model again, while different embedders are warmed up in parallel.
+_EMBEDDER_WARM_UPS: Dict[Hashable, "Future[Any]"] = {}
+_EMBEDDER_CACHE_LOCK = threading.Lock()
+
+
+def _embedder_cache_key(document_embedder: Any) -> Hashable:
+    """
+    Computes the cache key of an embedder from its serialized configuration.
+
+    Embedders that can't be serialized (e.g. because they hold a token-based Secret) are keyed by identity.
+    """
+    embedder_type = f"{type(document_embedder).__module__}.{type(document_embedder).__qualname__}"
+    try:
+        config = json.dumps(document_embedder.to_dict(), sort_keys=True, default=str)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return embedder_type, id(document_embedder)
+    return embedder_type, config
+
 
 class DistributedChatMessageStore(ChatMessageStore):
     """
     Stores chat messages in-memory.
     """
+
+    # Services often create one store per session, so instances are kept small and without a `__dict__`.
+    __slots__ = (
+        "_document_store",
+        "_emb_cache",
+        "_emb_cache_lock",
+        "_executor",
+        "_filters",
+        "_flush_lock",
+        "_flush_timer",
+        "_pending",
+        "_pending_lock",
+        "_recent",
+        "_recent_covers_filters",
+        "_retr_cache",
+        "_retriever",
+        "_user_id",
+        "document_embedder",
+        "embed_batch_size",
+        "embedding_cache_size",
+        "flush_interval_s",
+        "flush_threshold_docs",
+        "max_batch_chars",
+        "max_inflight",
+        "messages",
+        "recent_cache_size",
+        "retrieve_cache_ttl",
+        "write_batch_size",
+    )
+
     def __init__(
         self,
         document_store,
         document_embedder,
-        filters: Dict[str, Any] = None
+        filters: Dict[str, Any] = None,
+        embed_batch_size: int = 64,
+        max_batch_chars: Optional[int] = 150_000,
+        write_batch_size: Optional[int] = None,
+        max_inflight: int = 4,
+        flush_threshold_docs: Optional[int] = None,
+        flush_interval_s: Optional[float] = None,
+        embedding_cache_size: int = 0,
+        retrieve_cache_ttl: float = 0,
+        recent_cache_size: int = 256,
     ):
         """
         Initializes the InMemoryChatMessageStore.
+
+        :param document_store:
+            The document store the chat messages are written to and retrieved from.
+        :param document_embedder:
+            The embedder used to embed the chat messages. It is warmed up through `preload`, so if an embedder
+            with the same type and configuration is already cached, the store uses that instance instead and
+            `document_embedder` itself is not warmed up. The store's `document_embedder` attribute holds the
+            instance in use.
+        :param embed_batch_size:
+            Maximum number of documents passed to the embedder in a single call.
+        :param max_batch_chars:
+            Maximum total number of content characters passed to the embedder in a single call, so that batches
+            of long messages stay within memory and token limits. A single document longer than this limit is
+            embedded on its own. If `None`, batches are only limited by `embed_batch_size`.
+        :param write_batch_size:
+            Maximum number of documents written to the document store in a single call.
+            If `None`, every embedded batch is written as soon as it is available.
+        :param max_inflight:
+            Maximum number of embedder calls running concurrently. Batches are still written in input order.
+            Set to 1 for embedders that are not thread-safe or that gain nothing from concurrency.
+        :param flush_threshold_docs:
+            If set, written messages are buffered and flushed to the document store in one go once this many
+            messages are pending.
+        :param flush_interval_s:
+            If set, written messages are buffered and flushed at the latest this many seconds after the first
+            pending message was written.
+            If neither `flush_threshold_docs` nor `flush_interval_s` is set, messages are written immediately.
+            Pending messages are also flushed by `flush()`, before reading from the store, and when leaving the
+            store's context manager.
+        :param embedding_cache_size:
+            Maximum number of embeddings kept in an LRU cache keyed by message content, so that repeated contents
+            (system prompts, greetings, canned replies) are embedded only once. By default it is 0, which disables
+            the cache. The key also includes the meta fields listed in the embedder's `meta_fields_to_embed`, if
+            any. Only enable the cache if the embedding of a message depends on nothing else.
+        :param retrieve_cache_ttl:
+            Number of seconds for which the result of `retrieve` is reused for identical filters. The cache is
+            cleared whenever this store writes or deletes messages, but writes made through other store
+            instances can take up to this long to become visible. By default it is 0, which disables the cache.
+        :param recent_cache_size:
+            Number of most recently written messages kept in memory to answer `retrieve(last_n=...)` without
+            querying the document store. This is only used when the filters select nothing but the user ID, and
+            it only includes messages written through this store instance: messages written for the same user
+            through other store instances are not seen. Set to 0 to disable it.
         """
+        if embed_batch_size < 1:
+            raise ValueError("embed_batch_size must be a positive integer.")
+        if max_batch_chars is not None and max_batch_chars < 1:
+            raise ValueError("max_batch_chars must be a positive integer or None.")
+        if write_batch_size is not None and write_batch_size < 1:
+            raise ValueError("write_batch_size must be a positive integer or None.")
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be a positive integer.")
+        if flush_threshold_docs is not None and flush_threshold_docs < 1:
+            raise ValueError("flush_threshold_docs must be a positive integer or None.")
+        if flush_interval_s is not None and flush_interval_s <= 0:
+            raise ValueError("flush_interval_s must be a positive number or None.")
+        if embedding_cache_size < 0:
+            raise ValueError("embedding_cache_size must be a non-negative integer.")
+        if retrieve_cache_ttl < 0:
+            raise ValueError("retrieve_cache_ttl must be a non-negative number.")
+        if recent_cache_size < 0:
+            raise ValueError("recent_cache_size must be a non-negative integer.")
+
+        self.recent_cache_size = recent_cache_size
+        self._recent: "deque[Document]" = deque(maxlen=recent_cache_size)
+        self._retriever: Optional["FilterRetriever"] = None
+        self._retr_cache: "OrderedDict[bytes, Tuple[float, List[Document]]]" = OrderedDict()
         self.document_store=document_store
-        self.document_embedder=document_embedder
-        self.document_embedder.warm_up()
+        self.document_embedder=self.preload(document_embedder)
         self.filters = filters
+        self.embed_batch_size = embed_batch_size
+        self.max_batch_chars = max_batch_chars
+        self.write_batch_size = write_batch_size
+        self.max_inflight = max_inflight
+        self.flush_threshold_docs = flush_threshold_docs
+        self.flush_interval_s = flush_interval_s
+        self._pending: List[Document] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Held while buffered messages are taken and written, so readers can wait for a flush in progress
+        self._flush_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.embedding_cache_size = embedding_cache_size
+        self._emb_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._emb_cache_lock = threading.Lock()
+        self.retrieve_cache_ttl = retrieve_cache_ttl
+        self.messages: List[ChatMessage] = []
+
+    @property
+    def filters(self) -> Optional[Dict[str, Any]]:
+        """
+        The filters used to retrieve chat messages.
+
+        If they are an equality condition on `meta.user_id`, or an `AND` of conditions that includes one, written
+        messages are tagged with that user ID.
+        """
+        return self._filters
+
+    @filters.setter
+    def filters(self, filters: Optional[Dict[str, Any]]) -> None:
+        if filters != getattr(self, "_filters", None):
+            # Recently written messages were tagged for the previous filters
+            self._recent.clear()
+        self._filters = filters
+        # Parsed once here so that write_messages doesn't need to walk the filters
+        self._user_id = self._find_user_id(filters)
+        # Every message written by this store matches filters that select nothing but its user ID. Without such a
+        # filter the store reads the messages of all users, which other writers add to as well.
+        self._recent_covers_filters = (
+            filters is not None and self._user_id is not None and len(filters.get("conditions", [filters])) == 1
+        )
+
+    @staticmethod
+    def _find_user_id(filters: Optional[Dict[str, Any]]) -> Optional[Any]:
+        if not filters:
+            return None
+        if "conditions" in filters:
+            # Under `NOT` or `OR`, a user ID condition doesn't mean that the selected messages belong to that user
+            if filters.get("operator") != "AND":
+                return None
+            conditions = filters["conditions"]
+        else:
+            conditions = [filters]
+        return next(
+            (
+                condition["value"]
+                for condition in conditions
+                if condition.get("field") == _USER_ID_FIELD and condition.get("operator") == "=="
+            ),
+            None,
+        )
+
+    @property
+    def document_store(self):
+        """
+        The document store the chat messages are written to and retrieved from.
+        """
+        return self._document_store
+
+    @document_store.setter
+    def document_store(self, document_store) -> None:
+        self._document_store = document_store
+        # The cached retriever and results belong to the previous document store
+        self._retriever = None
+        self._retr_cache = OrderedDict()
+        self._recent.clear()
+
+    def __enter__(self) -> "DistributedChatMessageStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._pending_lock:
+                executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+    @classmethod
+    def preload(cls, document_embedder: Any) -> Any:
+        """
+        Warms up an embedder once and caches it for reuse by all DistributedChatMessageStore instances.
+
+        Call this at service startup to pay the model loading cost before the first request. The embedder stays
+        cached as long as it is referenced elsewhere, so keep a reference to the returned embedder.
+
+        :param document_embedder:
+            The embedder to warm up.
+        :returns:
+            The warmed-up embedder. If an embedder with the same type and configuration was already preloaded,
+            that instance is returned instead and `document_embedder` is not warmed up.
+        """
+        key = _embedder_cache_key(document_embedder)
+        with _EMBEDDER_CACHE_LOCK:
+            cached = _EMBEDDER_CACHE.get(key)
+            if cached is not None:
+                return cached
+            running = _EMBEDDER_WARM_UPS.get(key)
+            if running is None:
+                warm_up: "Future[Any]" = Future()
+                _EMBEDDER_WARM_UPS[key] = warm_up
+        if running is not None:
+            return running.result()
 
+        # The model is loaded without holding the lock, so that other embedders can be warmed up meanwhile
+        try:
+            document_embedder.warm_up()
+        except BaseException as e:
+            with _EMBEDDER_CACHE_LOCK:
+                del _EMBEDDER_WARM_UPS[key]
+            warm_up.set_exception(e)
+            raise
+        with _EMBEDDER_CACHE_LOCK:
+            # Embedders that don't support weak references are not cached
+            with contextlib.suppress(TypeError):
+                _EMBEDDER_CACHE[key] = document_embedder
+            del _EMBEDDER_WARM_UPS[key]
+        warm_up.set_result(document_embedder)
+        return document_embedder
 
     @staticmethod
     def to_document(chat_message: ChatMessage) -> Document:
         """
         Converts a ChatMessage to a Document.
 
+        The message role and the current time, as integer seconds since the epoch, are added to the meta.
+
         :param chat_message:
             The ChatMessage to convert.
         :returns:
@@ -48,7 +327,7 @@ class DistributedChatMessageStore(ChatMessageStore):
         """
         return Document(
             content=chat_message.text,
-            meta={**chat_message.meta,  **{"role": chat_message.role,  "timestamp": int(time.time())}},
+            meta={**chat_message.meta, "role": chat_message.role, "timestamp": int(time.time())},
         )
 
 
@@ -64,7 +343,7 @@ class DistributedChatMessageStore(ChatMessageStore):
         )
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DistibutedChatMessageStore":
+    def from_dict(cls, data: Dict[str, Any]) -> "DistributedChatMessageStore":
         """
         Deserializes the component from a dictionary.
 
@@ -87,39 +366,320 @@ class DistributedChatMessageStore(ChatMessageStore):
         """
         Writes chat messages to the ChatMessageStore.
 
+        Each message is stored as a Document with the message role and a `timestamp` meta field holding
+        integer seconds since the epoch, shared by all messages of one call.
+
         :param messages: A list of ChatMessages to write.
         :returns: The number of messages written.
 
         :raises ValueError: If messages is not a list of ChatMessages.
         """
-        if not isinstance(messages, Iterable) or any(not isinstance(message, ChatMessage) for message in messages):
-            raise ValueError("Please provide a list of ChatMessages.")
-        
-        documents = [self.to_document(message) for message in messages]
-        self.document_store.write_documents(self.document_embedder.run(documents)['documents'])
+        # Validation happens while converting, so the messages are only iterated once.
+        # All messages of a call share one timestamp; this is the inlined equivalent of `to_document`.
+        timestamp = int(time.time())
+        user_meta = {} if self._user_id is None else {"user_id": self._user_id}
+        try:
+            documents = [
+                Document(
+                    content=message.text,
+                    meta={**message.meta, **user_meta, "role": message.role, "timestamp": timestamp},
+                )
+                for message in messages
+            ]
+        except (AttributeError, TypeError) as e:
+            raise ValueError("Please provide a list of ChatMessages.") from e
+        if not documents:
+            return 0
+        logger.debug("Writing {count} chat messages", count=len(documents))
+
+        if self.flush_threshold_docs is None and self.flush_interval_s is None:
+            self._embed_and_write(documents)
+            return len(documents)
+
+        with self._pending_lock:
+            self._pending.extend(documents)
+            flush_now = self.flush_threshold_docs is not None and len(self._pending) >= self.flush_threshold_docs
+            if not flush_now and self.flush_interval_s is not None and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_s, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if flush_now:
+            self.flush()
+
+        return len(documents)
+
+    def flush(self) -> int:
+        """
+        Embeds and writes all buffered messages to the document store.
+
+        If another flush is in progress, this waits until its messages have been written.
 
+        :returns: The number of messages flushed.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                documents = self._take_pending()
+            if documents:
+                self._embed_and_write(documents)
         return len(documents)
 
+    def _take_pending(self) -> List[Document]:
+        """
+        Empties the write buffer and cancels the pending flush timer. Must be called while holding `_pending_lock`.
+        """
+        documents, self._pending = self._pending, []
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        return documents
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Failed to flush buffered chat messages: {error}", error=e)
+
+    def _embed_and_write(self, documents: List[Document]) -> None:
+        """
+        Embeds the documents and writes them to the document store.
+        """
+        pending: List[Document] = []
+        try:
+            for embedded in self._embedded_batches(list(self._pack(documents))):
+                pending.extend(embedded)
+                size = self.write_batch_size or len(pending)
+                while pending and len(pending) >= size:
+                    self._write(pending[:size])
+                    pending = pending[size:]
+            if pending:
+                self._write(pending)
+        finally:
+            # Also after a failure, as some batches might have been written already
+            self._retr_cache.clear()
+
+    def _embedded_batches(self, batches: List[List[Document]]) -> Iterator[List[Document]]:
+        """
+        Embeds the batches and yields them in input order.
+
+        A single batch is embedded in the calling thread. Otherwise, up to `max_inflight` batches are embedded
+        ahead on the store's executor, so the document store writes batch N while batch N+1 is being embedded.
+        """
+        if len(batches) == 1:
+            yield self._embed_batch(batches[0])
+            return
+
+        embed = self._embed_batch if self.max_inflight == 1 else self._embed_batch_with_jitter
+        executor = self._get_executor()
+        remaining = iter(batches)
+        futures = deque(executor.submit(embed, batch) for batch in islice(remaining, self.max_inflight))
+        try:
+            while futures:
+                embedded = futures.popleft().result()
+                next_batch = next(remaining, None)
+                if next_batch is not None:
+                    futures.append(executor.submit(embed, next_batch))
+                yield embedded
+        finally:
+            # If embedding or writing failed, the batches that haven't started yet are dropped
+            for future in futures:
+                future.cancel()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor used for embedding, creating it on first use.
+        """
+        with self._pending_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_inflight, thread_name_prefix="chat-store")
+            return self._executor
+
+    def _pack(self, documents: List[Document]) -> Iterator[List[Document]]:
+        """
+        Greedily groups documents into batches limited by `embed_batch_size` and `max_batch_chars`.
+        """
+        batch: List[Document] = []
+        batch_chars = 0
+        for doc in documents:
+            doc_chars = len(doc.content or "")
+            if batch and (
+                len(batch) >= self.embed_batch_size
+                or (self.max_batch_chars is not None and batch_chars + doc_chars > self.max_batch_chars)
+            ):
+                yield batch
+                batch, batch_chars = [], 0
+            batch.append(doc)
+            batch_chars += doc_chars
+        if batch:
+            yield batch
+
+    def _run_embedder(self, documents: List[Document]) -> List[Document]:
+        """
+        Runs the embedder on a batch, falling back to one call per document if the batch fails.
+
+        Out-of-memory errors of the common embedding backends (e.g. `torch.cuda.OutOfMemoryError`) are
+        `RuntimeError`s, so a batch that is too large for the device is retried document by document.
+        """
+        try:
+            return self.document_embedder.run(documents)["documents"]
+        except RuntimeError as e:
+            if len(documents) == 1:
+                raise
+            logger.warning(
+                "Embedding a batch of {count} documents failed, embedding them one by one instead: {error}",
+                count=len(documents),
+                error=e,
+            )
+            return [doc for document in documents for doc in self.document_embedder.run([document])["documents"]]
+
+    def _embed_batch(self, batch: List[Document]) -> List[Document]:
+        """
+        Embeds a batch of documents, serving contents seen before from the embedding cache.
+        """
+        if self.embedding_cache_size == 0:
+            return self._run_embedder(batch)
+
+        result = list(batch)
+        # Embedders such as SentenceTransformersDocumentEmbedder embed these meta fields along with the content
+        meta_fields = getattr(self.document_embedder, "meta_fields_to_embed", None) or []
+        keys: List[Optional[bytes]] = [
+            None if doc.content is None else self._embedding_cache_key(doc, meta_fields) for doc in batch
+        ]
+        to_embed: List[int] = []
+        with self._emb_cache_lock:
+            for i, key in enumerate(keys):
+                embedding = None if key is None else self._emb_cache.get(key)
+                if embedding is None:
+                    to_embed.append(i)
+                else:
+                    self._emb_cache.move_to_end(key)  # type: ignore[arg-type]
+                    # Copied so that documents don't share one embedding list with each other and with the cache
+                    batch[i].embedding = list(embedding)
+        if not to_embed:
+            return result
+
+        embedded = self._run_embedder([batch[i] for i in to_embed])
+        with self._emb_cache_lock:
+            for i, doc in zip(to_embed, embedded):
+                result[i] = doc
+                key = keys[i]
+                if key is not None and doc.embedding is not None:
+                    self._emb_cache[key] = list(doc.embedding)
+                    self._emb_cache.move_to_end(key)
+            while len(self._emb_cache) > self.embedding_cache_size:
+                self._emb_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _embedding_cache_key(document: Document, meta_fields: List[str]) -> bytes:
+        """
+        Computes the embedding cache key of a document from its content and the meta fields that are embedded.
+        """
+        key = hashlib.blake2b(document.content.encode(), digest_size=16)  # type: ignore[union-attr]
+        if meta_fields:
+            key.update(b"\0")
+            key.update(json.dumps([document.meta.get(field) for field in meta_fields], default=str).encode())
+        return key.digest()
+
+    def _embed_batch_with_jitter(self, batch: List[Document]) -> List[Document]:
+        time.sleep(random.uniform(0, _DISPATCH_JITTER_S))
+        return self._embed_batch(batch)
+
+    def _write(self, documents: List[Document]) -> None:
+        self.document_store.write_documents(documents)
+        if self._user_id is not None:
+            # Buffered documents might have been tagged for another user before the filters changed
+            self._recent.extend(doc for doc in documents if doc.meta.get("user_id") == self._user_id)
+
     def delete_messages(self) -> None:
         """
         Deletes all stored chat messages.
+
+        Buffered messages are discarded. Documents already written to the document store are not deleted.
         """
+        with self._pending_lock:
+            self._take_pending()
+        self._retr_cache.clear()
+        self._recent.clear()
         self.messages = []
 
-    def retrieve(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def retrieve(self, filters: Optional[Dict[str, Any]] = None, last_n: Optional[int] = None) -> List[Document]:
         """
         Retrieves all stored chat messages.
 
+        Buffered messages are flushed first, so they are included in the result.
+        If `retrieve_cache_ttl` is set, results are reused for identical filters for up to that many seconds.
+
+        :param filters: Filters to apply. If set, they replace the store's filters.
+        :param last_n:
+            If set, only the `last_n` most recent messages are returned, oldest first. When the filters select
+            nothing but the user ID and this store instance wrote at least `last_n` messages, they are served
+            from memory without querying the document store, so messages written for the same user through
+            other store instances are not seen.
         :returns: A list of chat messages.
 
         Building in semnatic matching shortly for
         constrained conversational memory retrieval
         """
 
+        # Imported lazily to keep importing this module cheap for write-only usage
+        from haystack.components.retrievers import FilterRetriever
+
+        if last_n is not None and last_n < 0:
+            raise ValueError("last_n must be a non-negative integer or None.")
+
+        self.flush()
+        if filters:
+            self.filters = filters
+
+        if last_n is not None and self._recent_covers_filters and last_n <= len(self._recent):
+            return list(self._recent)[len(self._recent) - last_n :]
+
+        key = None
+        if self.retrieve_cache_ttl > 0:
+            # Entries are ordered by the time they were cached, so the expired ones are at the front
+            expired_before = time.monotonic() - self.retrieve_cache_ttl
+            while self._retr_cache and next(iter(self._retr_cache.values()))[0] <= expired_before:
+                self._retr_cache.popitem(last=False)
+            key = hashlib.blake2b(json.dumps(self.filters, sort_keys=True, default=str).encode()).digest()
+            cached = self._retr_cache.get(key)
+            if cached is not None:
+                return list(cached[1])
+
+        if self._retriever is None:
+            self._retriever = FilterRetriever(self.document_store)
+        documents = self._retriever.run(filters=self.filters)["documents"]
+
+        if key is not None:
+            self._retr_cache[key] = (time.monotonic(), documents)
+            self._retr_cache.move_to_end(key)
+            while len(self._retr_cache) > _RETRIEVE_CACHE_SIZE:
+                self._retr_cache.popitem(last=False)
+        if last_n is not None:
+            documents = sorted(documents, key=lambda doc: doc.meta.get("timestamp", 0))
+            return documents[len(documents) - min(last_n, len(documents)) :]
+        return list(documents)
+
+    def retrieve_iter(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 256) -> Iterator[Document]:
+        """
+        Retrieves the stored chat messages lazily.
+
+        If the document store provides a `filter_documents_stream(filters, batch_size)` method, documents are
+        fetched from it `batch_size` at a time, so consumers can start working before all messages are loaded.
+        Otherwise, this falls back to `retrieve` and yields its results one by one.
+
+        :param filters: Filters to apply. If set, they replace the store's filters like in `retrieve`.
+        :param batch_size: Number of documents fetched from the document store at a time.
+        :returns: An iterator over the chat message documents.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        stream = getattr(self.document_store, "filter_documents_stream", None)
+        if stream is None:
+            yield from self.retrieve(filters=filters)
+            return
+
+        self.flush()
         if filters:
             self.filters = filters
-     
-        retriever = FilterRetriever(self.document_store)
-        result = retriever.run(filters=self.filters)
-        
-        return result['documents']
+        yield from stream(filters=self.filters, batch_size=batch_size)
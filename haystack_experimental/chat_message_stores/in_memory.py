@@ -65,7 +65,8 @@ class InMemoryChatMessageStore(ChatMessageStore):
 
         :raises ValueError: If messages is not a list of ChatMessages.
         """
-        if not isinstance(messages, Iterable) or any(not isinstance(message, ChatMessage) for message in messages):
+        # map() over the bound type check keeps the validation loop in C
+        if not isinstance(messages, Iterable) or not all(map(ChatMessage.__instancecheck__, messages)):
             raise ValueError("Please provide a list of ChatMessages.")
 
         self.messages.extend(messages)
@@ -22,6 +22,9 @@ class ChatMessageStore(ABC):
     In order to write or retrieve chat messages, consider using a ChatMessageWriter or ChatMessageRetriever.
     """
 
+    # Lets subclasses declare `__slots__`; subclasses that don't still get a `__dict__`.
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -7,7 +7,8 @@ import os
 from typing import Any, Dict, List, Optional, Union
 
 from haystack import component, default_from_dict, default_to_dict, logging
-from haystack.dataclasses import ChatMessage, StreamingChunk, ToolCall
+from haystack.dataclasses import ChatMessage, ChatRole, StreamingChunk, TextContent, ToolCall, ToolCallResult
+from haystack.lazy_imports import LazyImport
 from haystack.tools import Tool, deserialize_tools_inplace
 from haystack.utils import (
     Secret,
@@ -26,23 +27,64 @@ from haystack_experimental.dataclasses.streaming_chunk import (
     select_streaming_callback,
 )
 
+with LazyImport("Run 'pip install orjson'") as orjson_import:
+    import orjson
+
 logger = logging.getLogger(__name__)
 
+# Plain string values of the roles, so converting a message doesn't go through the Enum `value` descriptor
+_ROLE_VALUES: Dict[ChatRole, str] = {role: role.value for role in ChatRole}
+
+# `json.dumps` creates a new encoder whenever it's called with non-default options, so we create ours once.
+# We disable ensure_ascii so special chars like emojis are not converted.
+_ARGUMENTS_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _parse_tool_call_arguments(arguments: str) -> Any:
+    """
+    Parse the JSON string of tool call arguments returned by OpenAI.
+
+    If `orjson` is installed, it is used as it parses small JSON objects much faster than the standard library.
+
+    :raises json.JSONDecodeError: If the string is not valid JSON.
+    """
+    if orjson_import.is_successful():
+        try:
+            return orjson.loads(arguments)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than `json`, e.g. it rejects NaN or very large integers, so `json` has the final say
+            pass
+    return json.loads(arguments)
+
 
 def _convert_message_to_openai_format(message: ChatMessage) -> Dict[str, Any]:
     """
     Convert a message to the format expected by OpenAI's Chat API.
     """
-    text_contents = message.texts
-    tool_calls = message.tool_calls
-    tool_call_results = message.tool_call_results
+    # Most messages, e.g. all user and system messages, consist of a single text. They are always valid.
+    content = message._content
+    if len(content) == 1 and isinstance(content[0], TextContent):
+        return {"role": _ROLE_VALUES[message._role], "content": content[0].text}
+
+    # We sort the content parts in a single pass instead of going through the `texts`, `tool_calls` and
+    # `tool_call_results` properties, which each walk the whole content.
+    text_contents: List[str] = []
+    tool_calls: List[ToolCall] = []
+    tool_call_results: List[ToolCallResult] = []
+    for part in content:
+        if isinstance(part, TextContent):
+            text_contents.append(part.text)
+        elif isinstance(part, ToolCall):
+            tool_calls.append(part)
+        elif isinstance(part, ToolCallResult):
+            tool_call_results.append(part)
 
     if not text_contents and not tool_calls and not tool_call_results:
         raise ValueError("A `ChatMessage` must contain at least one `TextContent`, `ToolCall`, or `ToolCallResult`.")
     elif len(text_contents) + len(tool_call_results) > 1:
         raise ValueError("A `ChatMessage` can only contain one `TextContent` or one `ToolCallResult`.")
 
-    openai_msg: Dict[str, Any] = {"role": message._role.value}
+    openai_msg: Dict[str, Any] = {"role": _ROLE_VALUES[message._role]}
 
     if tool_call_results:
         result = tool_call_results[0]
@@ -64,10 +106,9 @@ def _convert_message_to_openai_format(message: ChatMessage) -> Dict[str, Any]:
                 {
                     "id": tc.id,
                     "type": "function",
-                    # We disable ensure_ascii so special chars like emojis are not converted
                     "function": {
                         "name": tc.tool_name,
-                        "arguments": json.dumps(tc.arguments, ensure_ascii=False),
+                        "arguments": _ARGUMENTS_ENCODER.encode(tc.arguments),
                     },
                 }
             )
@@ -512,7 +553,7 @@ class OpenAIChatGenerator:
             for payload in payloads:
                 arguments_str = payload["arguments"]
                 try:
-                    arguments = json.loads(arguments_str)
+                    arguments = _parse_tool_call_arguments(arguments_str)
                     tool_calls.append(
                         ToolCall(
                             id=payload["id"],
@@ -554,7 +595,7 @@ class OpenAIChatGenerator:
             for openai_tc in openai_tool_calls:
                 arguments_str = openai_tc.function.arguments
                 try:
-                    arguments = json.loads(arguments_str)
+                    arguments = _parse_tool_call_arguments(arguments_str)
                     tool_calls.append(
                         ToolCall(
                             id=openai_tc.id,
@@ -3,21 +3,118 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import atexit
+import contextlib
+import contextvars
+import functools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, nullcontext
 from copy import deepcopy
-from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, ContextManager, Coroutine, Dict, List, Optional, Set, TypeVar, cast
 
 from haystack import logging, tracing
 from haystack.core.component import Component
 from haystack.core.errors import PipelineMaxComponentRuns, PipelineRuntimeError
+from haystack.lazy_imports import LazyImport
 from haystack.telemetry import pipeline_running
+from haystack.tracing import Span
+from haystack.tracing.tracer import NullSpan
 
 from haystack_experimental.core.pipeline.base import (
     ComponentPriority,
     PipelineBase,
 )
+from haystack_experimental.core.pipeline.utils import FIFOPriorityQueue
+
+with LazyImport("Run 'pip install uvloop'") as uvloop_import:
+    import uvloop
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_NULL_SPAN = NullSpan()
+
+# Event loop runner reused by `AsyncPipeline.run` when called from the main thread
+_main_thread_runner: Optional["asyncio.Runner"] = None
+
+
+def _create_eager_task(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """
+    Creates a task that starts running the coroutine immediately, without waiting for the next event loop turn.
+
+    A coroutine that completes without suspending (e.g. a cheap component) finishes within this call.
+    Eager tasks need Python 3.12+; on older versions this falls back to `asyncio.create_task`.
+
+    :param coro: The coroutine to wrap in a task.
+    :returns: The created task.
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+    return asyncio.create_task(coro)
+
+
+def _run_in_new_event_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a coroutine to completion in a new event loop, like `asyncio.run`.
+
+    If `uvloop` is installed, its faster event loop implementation is used.
+
+    :param coro: The coroutine to run.
+    :returns: The result of the coroutine.
+    """
+    if not uvloop_import.is_successful():
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    return uvloop.run(coro)
+
+
+def _run_in_thread_event_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs a coroutine to completion in an event loop that is reused for all calls from the main thread.
+
+    This saves creating and closing a new event loop on every call. Each call runs in a fresh copy of the current
+    context, so context variables don't leak from one call to the next.
+    Other threads, e.g. the executor threads running sync components of an outer pipeline, can be short-lived and
+    nothing would close their event loop when they exit, so they run every call in a new event loop instead.
+    If `uvloop` is installed, its faster event loop implementation is used.
+    Reusing the event loop needs Python 3.11+; on older versions this falls back to `_run_in_new_event_loop`.
+
+    :param coro: The coroutine to run.
+    :returns: The result of the coroutine.
+    """
+    global _main_thread_runner  # pylint: disable=global-statement
+    if sys.version_info < (3, 11) or threading.current_thread() is not threading.main_thread():
+        return _run_in_new_event_loop(coro)
+
+    if _main_thread_runner is None:
+        loop_factory = uvloop.new_event_loop if uvloop_import.is_successful() else None
+        _main_thread_runner = asyncio.Runner(loop_factory=loop_factory)
+    return _main_thread_runner.run(coro, context=contextvars.copy_context())
+
+
+@atexit.register
+def _close_main_thread_runner() -> None:
+    if _main_thread_runner is not None:
+        # Raises if the process exits while the runner's event loop is still running
+        with contextlib.suppress(RuntimeError):
+            _main_thread_runner.close()
+
+
+async def _cancel_tasks(tasks: Dict["asyncio.Task", str]) -> None:
+    """
+    Cancels the given tasks and waits until they have finished.
+
+    :param tasks: The tasks to cancel.
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class AsyncPipeline(PipelineBase):
     """
@@ -31,6 +128,7 @@ class AsyncPipeline(PipelineBase):
         data: Dict[str, Any],
         include_outputs_from: Optional[Set[str]] = None,
         concurrency_limit: int = 4,
+        deep_copy_outputs: bool = False,
     ) -> AsyncIterator[Dict[str, Any]]:
         """
         Execute this pipeline asynchronously, yielding partial outputs when any component finishes.
@@ -42,7 +140,12 @@ class AsyncPipeline(PipelineBase):
             included in the pipeline's output. For components that are
             invoked multiple times (in a loop), only the last-produced
             output is included.
+        :param deep_copy_outputs:
+            If `True`, all yielded outputs are deep copies that the consumer can safely mutate.
         :return: An async iterator of partial (and final) outputs.
+            Unless `deep_copy_outputs` is set, partial outputs are shallow copies and the final outputs are the
+            pipeline's own output dictionary. The output values themselves are shared with the pipeline and with
+            downstream components, so consumers must copy them if they intend to mutate them.
         """
         if include_outputs_from is None:
             include_outputs_from = set()
@@ -51,14 +154,18 @@ class AsyncPipeline(PipelineBase):
         pipeline_running(self)  # telemetry
         self.warm_up()          # optional warm-up (if needed)
 
+        # Tracing can be switched on or off at any time, so we check once per run rather than once per process.
+        # If it is off, components run without entering the tracer.
+        tracing_enabled = tracing.is_tracing_enabled()
+
         # 1) Prepare ephemeral state
         ready_sem = asyncio.Semaphore(max(1, concurrency_limit))
         inputs_state: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
         pipeline_outputs: Dict[str, Any] = {}
         running_tasks: Dict[asyncio.Task, str] = {}
-
-        # A set of component names that have been scheduled but not finished:
-        scheduled_components: Set[str] = set()
+        # Tasks are put here by a done-callback as soon as they finish, so waiting for the next finished task
+        # doesn't need to install and remove callbacks on every running task like `asyncio.wait` does.
+        completion_queue: "asyncio.Queue[asyncio.Task]" = asyncio.Queue()
 
         # 2) Convert input data
         prepared_data = self._prepare_component_input_data(data)
@@ -66,25 +173,83 @@ class AsyncPipeline(PipelineBase):
         inputs_state = self._convert_to_internal_format(prepared_data)
 
         # For quick lookup of downstream receivers
-        ordered_names = sorted(self.graph.nodes.keys())
-        cached_receivers = {
-            n: self._find_receivers_from(n) for n in ordered_names
-        }
+        ordered_names, cached_receivers = self._get_ordered_names_and_receivers()
         component_visits = {component_name: 0 for component_name in ordered_names}
 
+        # Flags for components that have been scheduled but not finished, indexed by position in `ordered_names`:
+        name_to_idx = {n: i for i, n in enumerate(ordered_names)}
+        scheduled_mask = bytearray(len(ordered_names))
+        # Graph metadata doesn't change during a run, only the visits do
+        static_comp_dicts = {
+            n: self._get_component_with_graph_metadata_and_visits(n, 0) for n in ordered_names
+        }
+
+        def _partial_outputs(component_name: str, outputs: Dict[str, Any]) -> Dict[str, Any]:
+            return {component_name: deepcopy(outputs) if deep_copy_outputs else dict(outputs)}
+
+        def _get_comp_dict(component_name: str) -> Dict[str, Any]:
+            return {**static_comp_dicts[component_name], "visits": component_visits[component_name]}
+
+        # Defaults can only be missing for components with optional input sockets
+        has_optional_inputs = {
+            n: any(not socket.is_mandatory for socket in static_comp_dicts[n]["input_sockets"].values())
+            for n in ordered_names
+        }
+
+        def _add_missing_input_defaults(
+            component_name: str, component_inputs: Dict[str, Any], comp_dict: Dict[str, Any]
+        ) -> Dict[str, Any]:
+            input_sockets = comp_dict["input_sockets"]
+            if has_optional_inputs[component_name] and len(component_inputs) < len(input_sockets):
+                return self._add_missing_input_defaults(component_inputs, input_sockets)
+            return component_inputs
+
+        # Priorities only change for components whose inputs or visits changed. We keep the last computed
+        # priority of every component and only recalculate it for components marked as dirty.
+        priorities: Dict[str, ComponentPriority] = {}
+        dirty: Set[str] = set(ordered_names)
+        # If no component is dirty, the queue would be rebuilt with exactly the same entries, so we copy it instead
+        last_queue: Optional[FIFOPriorityQueue] = None
+
+        def _build_priority_queue() -> FIFOPriorityQueue:
+            nonlocal last_queue
+            if not dirty and last_queue is not None:
+                return last_queue.copy()
+            for name in dirty:
+                comp_dict = _get_comp_dict(name)
+                priorities[name] = self._calculate_priority(comp_dict, inputs_state.get(name, {}))
+            dirty.clear()
+            # Same insertion order as `_fill_queue`, so components with equal priority are picked in the same order
+            queue = FIFOPriorityQueue()
+            for name in ordered_names:
+                queue.push(name, priorities[name])
+            last_queue = queue.copy()
+            return queue
+
         # We fill the queue once and raise if all components are BLOCKED
-        self.validate_pipeline(self._fill_queue(ordered_names, inputs_state, component_visits))
-
-        # Single parent span for entire pipeline execution
-        with tracing.tracer.trace(
-            "haystack.async_pipeline.run",
-            tags={
-                "haystack.pipeline.input_data": data,
-                "haystack.pipeline.output_data": pipeline_outputs,
-                "haystack.pipeline.metadata": self.metadata,
-                "haystack.pipeline.max_runs_per_component": self._max_runs_per_component,
-            },
-        ) as parent_span:
+        self.validate_pipeline(_build_priority_queue())
+
+        async with AsyncExitStack() as exit_stack:
+            # Sync components run on an executor scoped to this run and sized to the concurrency limit. Threads are
+            # only started on demand and are released as soon as the generator is exhausted or closed.
+            executor = ThreadPoolExecutor(max_workers=max(1, concurrency_limit), thread_name_prefix="haystack-sync")
+            exit_stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            # If a component fails or the generator is closed early, the components still running are cancelled.
+            # Otherwise they would keep running on the event loop, which `run` reuses for the next call.
+            exit_stack.push_async_callback(_cancel_tasks, running_tasks)
+
+            # Single parent span for entire pipeline execution
+            parent_span = exit_stack.enter_context(
+                tracing.tracer.trace(
+                    "haystack.async_pipeline.run",
+                    tags={
+                        "haystack.pipeline.input_data": data,
+                        "haystack.pipeline.output_data": pipeline_outputs,
+                        "haystack.pipeline.metadata": self.metadata,
+                        "haystack.pipeline.max_runs_per_component": self._max_runs_per_component,
+                    },
+                )
+            )
 
             # -------------------------------------------------
             # We define some functions here so that they have access to local runtime state
@@ -111,30 +276,31 @@ class AsyncPipeline(PipelineBase):
                     )
 
                 instance: Component = self.get_component(component_name)
-                with tracing.tracer.trace(
-                    "haystack.component.run_async",
-                    tags={
-                        "haystack.component.name": component_name,
-                        "haystack.component.type": instance.__class__.__name__,
-                        "haystack.component.input_types": {k: type(v).__name__ for k, v in component_inputs.items()},
-                        "haystack.component.input_spec": {
-                            key: {
-                                "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
-                                "senders": value.senders,
-                            }
-                            for key, value in instance.__haystack_input__._sockets_dict.items()  # type: ignore
-                        },
-                        "haystack.component.output_spec": {
-                            key: {
-                                "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
-                                "receivers": value.receivers,
-                            }
-                            for key, value in instance.__haystack_output__._sockets_dict.items()  # type: ignore
+                trace_context: ContextManager[Span]
+                if tracing_enabled:
+                    input_spec, output_spec = self._get_component_spec_tags(component_name)
+                    trace_context = tracing.tracer.trace(
+                        "haystack.component.run_async",
+                        tags={
+                            "haystack.component.name": component_name,
+                            "haystack.component.type": instance.__class__.__name__,
+                            "haystack.component.input_types": {
+                                k: type(v).__name__ for k, v in component_inputs.items()
+                            },
+                            "haystack.component.input_spec": input_spec,
+                            "haystack.component.output_spec": output_spec,
                         },
-                    },
-                    parent_span=parent_span
-                ) as span:
-                    span.set_content_tag("haystack.component.input", deepcopy(component_inputs))
+                        parent_span=parent_span
+                    )
+                else:
+                    # Without a tracer there is nothing to record, so we don't enter the tracer at all
+                    trace_context = nullcontext(_NULL_SPAN)
+
+                with trace_context as span:
+                    # Inputs are only copied if content tracing will actually record them, since they might
+                    # be mutated by the component afterwards.
+                    if tracing_enabled and tracing.tracer.is_content_tracing_enabled:
+                        span.set_content_tag("haystack.component.input", deepcopy(component_inputs))
                     logger.info("Running component {name}", name=component_name)
 
                     if getattr(instance, "__haystack_supports_async__", False):
@@ -142,7 +308,7 @@ class AsyncPipeline(PipelineBase):
                     else:
                         loop = asyncio.get_running_loop()
                         outputs = await loop.run_in_executor(
-                            None, lambda: instance.run(**component_inputs)
+                            executor, functools.partial(instance.run, **component_inputs)
                         )
 
                 component_visits[component_name] += 1
@@ -153,8 +319,9 @@ class AsyncPipeline(PipelineBase):
                         f"Expected a dict, but got {type(outputs).__name__} instead. "
                     )
 
-                span.set_tag("haystack.component.visits", component_visits[component_name])
-                span.set_content_tag("haystack.component.outputs", deepcopy(outputs))
+                if tracing_enabled:
+                    span.set_tag("haystack.component.visits", component_visits[component_name])
+                    span.set_content_tag("haystack.component.outputs", outputs)
 
                 # Distribute outputs to downstream inputs; also prune outputs based on `include_outputs_from`
                 pruned, _ = self._write_component_outputs(
@@ -167,6 +334,10 @@ class AsyncPipeline(PipelineBase):
                 if pruned:
                     pipeline_outputs[component_name] = pruned
 
+                # Visits of this component and inputs of its receivers changed
+                dirty.add(component_name)
+                dirty.update(receiver for receiver, _, _ in cached_receivers[component_name])
+
                 return pruned
 
             async def _run_highest_in_isolation(component_name: str) -> AsyncIterator[Dict[str, Any]]:
@@ -180,41 +351,39 @@ class AsyncPipeline(PipelineBase):
                 :return: An async iterator of partial outputs.
                 """
                 # 1) Wait for all in-flight tasks to finish
-                while running_tasks:
-                    done, _pending = await asyncio.wait(
-                        running_tasks.keys(),
-                        return_when=asyncio.ALL_COMPLETED,
-                    )
-                    for finished in done:
-                        finished_component_name = running_tasks.pop(finished)
-                        partial_result = finished.result()
-                        scheduled_components.discard(finished_component_name)
+                if running_tasks:
+                    in_flight = list(running_tasks.items())
+                    # Failures are collected so that all tasks have finished before the first one is re-raised
+                    results = await asyncio.gather(*running_tasks, return_exceptions=True)
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            raise result
+                    for (finished, finished_component_name), partial_result in zip(in_flight, results):
+                        running_tasks.pop(finished)
+                        scheduled_mask[name_to_idx[finished_component_name]] = 0
                         if partial_result:
-                            yield_dict = {finished_component_name: deepcopy(partial_result)}
-                            yield yield_dict  # partial outputs
+                            # Exceptions were re-raised above, so every result is a component's outputs
+                            finished_outputs = cast(Dict[str, Any], partial_result)
+                            yield _partial_outputs(finished_component_name, finished_outputs)  # partial outputs
 
-                if component_name in scheduled_components:
+                if scheduled_mask[name_to_idx[component_name]]:
                     # If it's already scheduled for some reason, skip
                     return
 
                 # 2) Run the HIGHEST component by itself
-                scheduled_components.add(component_name)
-                comp_dict = self._get_component_with_graph_metadata_and_visits(
-                    component_name,
-                    component_visits[component_name]
-                )
+                scheduled_mask[name_to_idx[component_name]] = 1
+                comp_dict = _get_comp_dict(component_name)
                 component_inputs, _ = self._consume_component_inputs(
                     component_name, comp_dict, inputs_state
                 )
-                component_inputs = self._add_missing_input_defaults(
-                    component_inputs, comp_dict["input_sockets"]
-                )
+                dirty.add(component_name)
+                component_inputs = _add_missing_input_defaults(component_name, component_inputs, comp_dict)
                 result = await _run_component_async(component_name, component_inputs)
-                scheduled_components.remove(component_name)
+                scheduled_mask[name_to_idx[component_name]] = 0
                 if result:
-                    yield {component_name: deepcopy(result)}
+                    yield _partial_outputs(component_name, result)
 
-            async def _schedule_ready_task(component_name: str) -> None:
+            def _schedule_ready_task(component_name: str) -> None:
                 """
                 Schedule a component that is considered READY (or just turned READY).
 
@@ -223,31 +392,45 @@ class AsyncPipeline(PipelineBase):
                 :param component_name: The name of the component.
                 """
 
-                if component_name in scheduled_components:
+                if scheduled_mask[name_to_idx[component_name]]:
                     return  # already scheduled, do nothing
 
-                scheduled_components.add(component_name)
+                scheduled_mask[name_to_idx[component_name]] = 1
 
-                comp_dict = self._get_component_with_graph_metadata_and_visits(
-                    component_name,
-                    component_visits[component_name]
-                )
+                comp_dict = _get_comp_dict(component_name)
                 component_inputs, _ = self._consume_component_inputs(
                     component_name, comp_dict, inputs_state
                 )
-                component_inputs = self._add_missing_input_defaults(
-                    component_inputs, comp_dict["input_sockets"]
-                )
+                dirty.add(component_name)
+                component_inputs = _add_missing_input_defaults(component_name, component_inputs, comp_dict)
 
                 async def _runner():
                     async with ready_sem:
                         result = await _run_component_async(component_name, component_inputs)
 
-                    scheduled_components.remove(component_name)
+                    scheduled_mask[name_to_idx[component_name]] = 0
                     return result
 
-                task = asyncio.create_task(_runner())
+                task = _create_eager_task(_runner())
                 running_tasks[task] = component_name
+                task.add_done_callback(completion_queue.put_nowait)
+
+            async def _next_completed_tasks() -> List[asyncio.Task]:
+                """
+                Wait for at least one running task to finish and return all running tasks that have finished.
+
+                Tasks that were already collected by other means are skipped.
+                """
+                while True:
+                    finished = await completion_queue.get()
+                    if finished in running_tasks:
+                        break
+                done = [finished]
+                while not completion_queue.empty():
+                    finished = completion_queue.get_nowait()
+                    if finished in running_tasks:
+                        done.append(finished)
+                return done
 
             async def _wait_for_one_task_to_complete() -> AsyncIterator[Dict[str, Any]]:
                 """
@@ -256,32 +439,24 @@ class AsyncPipeline(PipelineBase):
                 If no tasks are running, does nothing.
                 """
                 if running_tasks:
-                    done, _ = await asyncio.wait(
-                        running_tasks.keys(),
-                        return_when=asyncio.FIRST_COMPLETED,
-                    )
-                    for finished in done:
+                    for finished in await _next_completed_tasks():
                         finished_component_name = running_tasks.pop(finished)
                         partial_result = finished.result()
-                        scheduled_components.discard(finished_component_name)
+                        scheduled_mask[name_to_idx[finished_component_name]] = 0
                         if partial_result:
-                            yield {finished_component_name: deepcopy(partial_result)}
+                            yield _partial_outputs(finished_component_name, partial_result)
 
             async def _wait_for_all_tasks_to_complete() -> AsyncIterator[Dict[str, Any]]:
                 """
                 Wait for all running tasks to finish, yield partial outputs.
                 """
-                if running_tasks:
-                    done, _ = await asyncio.wait(
-                        running_tasks.keys(),
-                        return_when=asyncio.ALL_COMPLETED,
-                    )
-                    for finished in done:
+                while running_tasks:
+                    for finished in await _next_completed_tasks():
                         finished_component_name = running_tasks.pop(finished)
                         partial_result = finished.result()
-                        scheduled_components.discard(finished_component_name)
+                        scheduled_mask[name_to_idx[finished_component_name]] = 0
                         if partial_result:
-                            yield {finished_component_name: deepcopy(partial_result)}
+                            yield _partial_outputs(finished_component_name, partial_result)
 
             async def _schedule_defer_incrementally(
                 component_name: str,
@@ -295,20 +470,17 @@ class AsyncPipeline(PipelineBase):
                 :param component_name: The name of the component.
                 :returns: An async iterator of partial outputs.
                 """
-                comp_dict = self._get_component_with_graph_metadata_and_visits(
-                    component_name,
-                    component_visits[component_name]
-                )
+                comp_dict = _get_comp_dict(component_name)
                 while True:
                     # Already scheduled => stop
-                    if component_name in scheduled_components:
+                    if scheduled_mask[name_to_idx[component_name]]:
                         return
                     # Priority is recalculated after each completed task
 
                     new_prio = self._calculate_priority(comp_dict, inputs_state.get(component_name, {}))
                     if new_prio == ComponentPriority.READY:
                         # It's now ready => schedule it
-                        await _schedule_ready_task(component_name)
+                        _schedule_ready_task(component_name)
                         return
 
                     elif new_prio == ComponentPriority.HIGHEST:
@@ -325,15 +497,44 @@ class AsyncPipeline(PipelineBase):
                     else:
                         # No tasks left => schedule anyway (end of pipeline)
                         # This ensures we don't deadlock forever.
-                        await _schedule_ready_task(component_name)
+                        _schedule_ready_task(component_name)
                         return
 
+            async def _run_serially() -> AsyncIterator[Dict[str, Any]]:
+                """
+                Runs components one after the other, without tasks, if only one component may run at a time.
+
+                The next component is picked from a fresh priority queue after every run, like in `Pipeline.run`.
+
+                :returns: An async iterator of partial outputs.
+                """
+                while True:
+                    candidate = self._get_next_runnable_component(_build_priority_queue(), component_visits)
+                    if candidate is None:
+                        return
+
+                    _, component_name, _ = candidate
+                    comp_dict = _get_comp_dict(component_name)
+                    component_inputs, _ = self._consume_component_inputs(
+                        component_name, comp_dict, inputs_state
+                    )
+                    dirty.add(component_name)
+                    component_inputs = _add_missing_input_defaults(component_name, component_inputs, comp_dict)
+                    result = await _run_component_async(component_name, component_inputs)
+                    if result:
+                        yield _partial_outputs(component_name, result)
+
+            if concurrency_limit == 1:
+                # Once this returns, no component can run anymore and the main loop below exits right away
+                async for partial_result in _run_serially():
+                    yield partial_result
+
             # -------------------------------------------------
             # MAIN SCHEDULING LOOP
             # -------------------------------------------------
             while True:
                 # 2) Build the priority queue of candidates
-                priority_queue = self._fill_queue(ordered_names, inputs_state, component_visits)
+                priority_queue = _build_priority_queue()
                 candidate = self._get_next_runnable_component(priority_queue, component_visits)
                 if candidate is None and running_tasks:
                     # We need to wait for one task to finish to make progress and potentially unblock the priority_queue
@@ -347,7 +548,7 @@ class AsyncPipeline(PipelineBase):
 
                 priority, component_name, _ = candidate #type: ignore
 
-                if component_name in scheduled_components:
+                if scheduled_mask[name_to_idx[component_name]]:
                     # We need to wait for one task to finish to make progress
                     async for partial_result in _wait_for_one_task_to_complete():
                         yield partial_result
@@ -362,7 +563,7 @@ class AsyncPipeline(PipelineBase):
 
                 if priority == ComponentPriority.READY:
                     # 1) schedule this one
-                    await _schedule_ready_task(component_name)
+                    _schedule_ready_task(component_name)
 
                     # 2) Possibly schedule more READY tasks if concurrency not fully used
                     while len(priority_queue) > 0 and not ready_sem.locked():
@@ -372,7 +573,7 @@ class AsyncPipeline(PipelineBase):
                             break
                         if peek_prio == ComponentPriority.READY:
                             priority_queue.pop()
-                            await _schedule_ready_task(peek_name)
+                            _schedule_ready_task(peek_name)
                             # keep adding while concurrency is not locked
                             continue
 
@@ -395,8 +596,8 @@ class AsyncPipeline(PipelineBase):
             async for partial_result in _wait_for_all_tasks_to_complete():
                 yield partial_result
 
-            # 4) Yield final pipeline outputs
-            yield deepcopy(pipeline_outputs)
+            # 4) Yield final pipeline outputs. No component runs anymore, so we can hand them out without copying.
+            yield deepcopy(pipeline_outputs) if deep_copy_outputs else pipeline_outputs
 
     async def run_async(
         self,
@@ -524,6 +725,8 @@ class AsyncPipeline(PipelineBase):
         Runs the pipeline with given input data.
 
         This method is synchronous, but it runs components asynchronously internally.
+        The event loop is reused for all calls from the main thread. If `uvloop` is installed, it is used as the
+        event loop.
         Check out `run_async` or `run_async_generator` if you are looking for async-methods.
 
         Usage:
@@ -620,7 +823,7 @@ class AsyncPipeline(PipelineBase):
         :raises PipelineMaxComponentRuns:
             If a Component reaches the maximum number of times it can be run in this Pipeline.
         """
-        return asyncio.run(
+        return _run_in_thread_event_loop(
             self.run_async(
                 data=data,
                 include_outputs_from=include_outputs_from,
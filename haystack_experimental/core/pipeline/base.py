@@ -84,6 +84,11 @@ class PipelineBase:
         self.metadata = metadata or {}
         self.graph = MultiDiGraph()
         self._max_runs_per_component = max_runs_per_component
+        # Tracing tags describing the sockets of each component, see `_get_component_spec_tags`
+        self._component_spec_tags: Dict[str, Tuple[Component, Dict[str, Any], Dict[str, Any]]] = {}
+        # Incremented whenever components or connections change, see `_get_ordered_names_and_receivers`
+        self._graph_version = 0
+        self._ordered_names_and_receivers: Optional[Tuple[int, List[str], Dict[str, List]]] = None
 
     def __eq__(self, other) -> bool:
         """
@@ -342,6 +347,7 @@ class PipelineBase:
             output_sockets=instance.__haystack_output__._sockets_dict,  # type: ignore[attr-defined]
             visits=0,
         )
+        self._graph_version += 1
 
     def remove_component(self, name: str) -> Component:
         """
@@ -370,6 +376,8 @@ class PipelineBase:
 
         # Delete component from the graph, deleting all its connections
         self.graph.remove_node(name)
+        self._component_spec_tags.pop(name, None)
+        self._graph_version += 1
 
         # Reset the Component sockets' senders and receivers
         input_sockets = instance.__haystack_input__._sockets_dict  # type: ignore[attr-defined]
@@ -555,6 +563,7 @@ class PipelineBase:
             to_socket=receiver_socket,
             mandatory=receiver_socket.is_mandatory,
         )
+        self._graph_version += 1
         return self
 
     def get_component(self, name: str) -> Component:
@@ -833,6 +842,59 @@ class PipelineBase:
             res.append((receiver_name, sender_socket, receiver_socket))
         return res
 
+    def _get_ordered_names_and_receivers(
+        self,
+    ) -> Tuple[List[str], Dict[str, List[Tuple[str, OutputSocket, InputSocket]]]]:
+        """
+        Returns the component names sorted by name, and the receivers of each component.
+
+        Sorting by name makes runs deterministic and independent of insertion order into the pipeline.
+        Both are cached until a component is added or removed or a connection is made, so they must not be mutated.
+
+        :returns: A tuple of the sorted component names and a dict mapping each name to its receivers,
+            as returned by `_find_receivers_from`.
+        """
+        cached = self._ordered_names_and_receivers
+        if cached is not None and cached[0] == self._graph_version:
+            return cached[1], cached[2]
+
+        ordered_names = sorted(self.graph.nodes.keys())
+        receivers = {name: self._find_receivers_from(name) for name in ordered_names}
+        self._ordered_names_and_receivers = (self._graph_version, ordered_names, receivers)
+        return ordered_names, receivers
+
+    def _get_component_spec_tags(self, component_name: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Returns the `input_spec` and `output_spec` tracing tags of a component.
+
+        The tags only depend on the component's sockets, so they are computed once per component and cached.
+        They reference the sockets' `senders` and `receivers` lists, so later connections are reflected.
+
+        :param component_name: The name of the component.
+        :returns: A tuple of the input spec and the output spec tags.
+        """
+        instance: Component = self.graph.nodes[component_name]["instance"]
+        cached = self._component_spec_tags.get(component_name)
+        if cached is not None and cached[0] is instance:
+            return cached[1], cached[2]
+
+        input_spec = {
+            key: {
+                "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
+                "senders": value.senders,
+            }
+            for key, value in instance.__haystack_input__._sockets_dict.items()  # type: ignore
+        }
+        output_spec = {
+            key: {
+                "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
+                "receivers": value.receivers,
+            }
+            for key, value in instance.__haystack_output__._sockets_dict.items()  # type: ignore
+        }
+        self._component_spec_tags[component_name] = (instance, input_spec, output_spec)
+        return input_spec, output_spec
+
     @staticmethod
     def _convert_to_internal_format(pipeline_inputs: Dict[str, Any]) -> Dict[str, Dict[str, List]]:
         """
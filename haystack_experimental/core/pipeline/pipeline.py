@@ -225,15 +225,13 @@ class Pipeline(PipelineBase):
 
         # We create a list of components in the pipeline sorted by name, so that the algorithm runs deterministically
         # and independent of insertion order into the pipeline.
-        ordered_component_names = sorted(self.graph.nodes.keys())
+        # We need to access a component's receivers multiple times during a pipeline run.
+        # Both are cached across runs until the pipeline graph changes.
+        ordered_component_names, cached_receivers = self._get_ordered_names_and_receivers()
 
         # We track component visits to decide if a component can run.
         component_visits = {component_name: 0 for component_name in ordered_component_names}
 
-        # We need to access a component's receivers multiple times during a pipeline run.
-        # We store them here for easy access.
-        cached_receivers = {name: self._find_receivers_from(name) for name in ordered_component_names}
-
         pipeline_outputs: Dict[str, Any] = {}
         with tracing.tracer.trace(
             "haystack.pipeline.run",
@@ -103,6 +103,21 @@ class FIFOPriorityQueue:
         priority, _, item = heapq.heappop(self._queue)
         return priority, item
 
+    def copy(self) -> "FIFOPriorityQueue":
+        """
+        Return a shallow copy of the queue.
+
+        The copy holds the same items with the same priorities and FIFO order. Items pushed to the copy are ordered
+        after all items already in it.
+
+        :returns:
+            A new queue that can be consumed independently of this one.
+        """
+        new_queue = FIFOPriorityQueue()
+        new_queue._queue = self._queue.copy()
+        new_queue._counter = count(next(self._counter))
+        return new_queue
+
     def __len__(self) -> int:
         """
         Return the number of items in the queue.
@@ -0,0 +1,554 @@
+import gc
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import pytest
+from haystack import Document, component, default_to_dict
+from haystack.dataclasses import ChatMessage
+from haystack.document_stores.in_memory import InMemoryDocumentStore
+
+from haystack_experimental.chat_message_stores import distributed
+from haystack_experimental.chat_message_stores.distributed import DistributedChatMessageStore
+
+
+@component
+class CountingEmbedder:
+    """
+    Assigns a fixed embedding to each document and records the size of every batch it receives.
+    """
+
+    def __init__(self):
+        self.batches: List[int] = []
+        self.warm_up_calls = 0
+
+    def warm_up(self):
+        self.warm_up_calls += 1
+
+    @component.output_types(documents=List[Document])
+    def run(self, documents: List[Document]):
+        self.batches.append(len(documents))
+        for doc in documents:
+            doc.embedding = [float(len(doc.content or ""))]
+        return {"documents": documents}
+
+
+@component
+class ModelEmbedder:
+    """
+    Like CountingEmbedder, but serializable, so it is cached by configuration.
+    """
+
+    def __init__(self, model: str, warm_up_barrier: Optional[threading.Barrier] = None):
+        self.model = model
+        self.warm_up_barrier = warm_up_barrier
+        self.warm_up_calls = 0
+
+    def warm_up(self):
+        self.warm_up_calls += 1
+        if self.warm_up_barrier is not None:
+            self.warm_up_barrier.wait()
+
+    def to_dict(self):
+        return default_to_dict(self, model=self.model)
+
+    @component.output_types(documents=List[Document])
+    def run(self, documents: List[Document]):
+        return {"documents": documents}
+
+
+class TestDistributedChatMessageStore:
+
+    def test_init(self):
+        """
+        Test that the DistributedChatMessageStore warms up the embedder.
+        """
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(document_store=InMemoryDocumentStore(), document_embedder=embedder)
+        assert embedder.warm_up_calls == 1
+        assert store.embed_batch_size == 64
+        assert store.write_batch_size is None
+        assert store.max_inflight == 4
+
+    def test_init_reuses_warmed_embedder(self):
+        """
+        Test that creating several stores with the same embedder only warms it up once.
+        """
+        embedder = CountingEmbedder()
+        DistributedChatMessageStore(document_store=InMemoryDocumentStore(), document_embedder=embedder)
+        DistributedChatMessageStore(document_store=InMemoryDocumentStore(), document_embedder=embedder)
+        assert embedder.warm_up_calls == 1
+
+    def test_preload(self):
+        embedder = CountingEmbedder()
+        assert DistributedChatMessageStore.preload(embedder) is embedder
+        assert embedder.warm_up_calls == 1
+        store = DistributedChatMessageStore(document_store=InMemoryDocumentStore(), document_embedder=embedder)
+        assert store.document_embedder is embedder
+        assert embedder.warm_up_calls == 1
+
+    def test_preload_does_not_keep_unserializable_embedders_alive(self):
+        embedder = CountingEmbedder()
+        DistributedChatMessageStore.preload(embedder)
+        embedder_ref = weakref.ref(embedder)
+        del embedder
+        gc.collect()
+        assert embedder_ref() is None
+
+    def test_init_shares_embedders_with_the_same_configuration(self):
+        first, same_config, other_config = ModelEmbedder("shared"), ModelEmbedder("shared"), ModelEmbedder("other")
+        DistributedChatMessageStore(InMemoryDocumentStore(), first)
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), same_config)
+        assert store.document_embedder is first
+        assert same_config.warm_up_calls == 0
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), other_config)
+        assert store.document_embedder is other_config
+        assert first.warm_up_calls == other_config.warm_up_calls == 1
+
+    def test_preload_warms_up_different_embedders_concurrently(self):
+        # Each warm-up only returns once the other one has started, so this would time out if they were serialized
+        barrier = threading.Barrier(2, timeout=5)
+        embedders = [ModelEmbedder("concurrent-a", barrier), ModelEmbedder("concurrent-b", barrier)]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            preloaded = list(executor.map(DistributedChatMessageStore.preload, embedders))
+        assert preloaded == embedders
+
+    def test_init_invalid_batch_sizes(self):
+        with pytest.raises(ValueError):
+            DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), embed_batch_size=0)
+        with pytest.raises(ValueError):
+            DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), write_batch_size=0)
+        with pytest.raises(ValueError):
+            DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), max_inflight=0)
+        with pytest.raises(ValueError):
+            DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), max_batch_chars=0)
+
+    def test_write_messages(self):
+        """
+        Test that written messages are embedded and stored in the document store.
+        """
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store=document_store, document_embedder=CountingEmbedder())
+        assert store.write_messages([ChatMessage.from_user("Hello"), ChatMessage.from_assistant("Hi!")]) == 2
+        documents = document_store.filter_documents()
+        assert sorted(doc.content for doc in documents) == ["Hello", "Hi!"]
+        assert all(doc.embedding is not None for doc in documents)
+
+    def test_write_messages_empty(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder())
+        assert store.write_messages([]) == 0
+
+    def test_write_messages_invalid_input(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder())
+        with pytest.raises(ValueError):
+            store.write_messages(["not a chat message"])
+        with pytest.raises(ValueError):
+            store.write_messages(None)
+
+    def test_write_messages_in_micro_batches(self):
+        """
+        Test that the embedder and the document store are called with batches of the configured size.
+        """
+        document_store = InMemoryDocumentStore()
+        written_batches = []
+        write_documents = document_store.write_documents
+
+        def spy_write_documents(documents, *args, **kwargs):
+            written_batches.append(len(documents))
+            return write_documents(documents, *args, **kwargs)
+
+        document_store.write_documents = spy_write_documents
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=embedder, embed_batch_size=3, write_batch_size=4
+        )
+        messages = [ChatMessage.from_user(f"Message {i}") for i in range(7)]
+        assert store.write_messages(messages) == 7
+        assert sorted(embedder.batches) == [1, 3, 3]
+        assert written_batches == [4, 3]
+        assert document_store.count_documents() == 7
+
+    def test_write_messages_batches_limited_by_characters(self):
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(
+            InMemoryDocumentStore(), embedder, embed_batch_size=3, max_batch_chars=10, max_inflight=1
+        )
+        contents = ["aaaa", "bbbb", "cc", "dddddddddddd", "e", "f", "g", "h"]
+        assert store.write_messages([ChatMessage.from_user(content) for content in contents]) == 8
+        assert embedder.batches == [3, 1, 3, 1]
+
+    def test_write_messages_falls_back_to_single_documents(self):
+        @component
+        class OutOfMemoryEmbedder:
+            def __init__(self):
+                self.batches: List[int] = []
+
+            def warm_up(self):
+                pass
+
+            @component.output_types(documents=List[Document])
+            def run(self, documents: List[Document]):
+                self.batches.append(len(documents))
+                if len(documents) > 1:
+                    raise RuntimeError("CUDA out of memory")
+                documents[0].embedding = [1.0]
+                return {"documents": documents}
+
+        document_store = InMemoryDocumentStore()
+        embedder = OutOfMemoryEmbedder()
+        store = DistributedChatMessageStore(document_store, embedder, max_inflight=1)
+        assert store.write_messages([ChatMessage.from_user("Hello"), ChatMessage.from_user("Hi")]) == 2
+        assert embedder.batches == [2, 1, 1]
+        assert [doc.embedding for doc in document_store.filter_documents()] == [[1.0], [1.0]]
+
+    def test_write_messages_concurrent_embedding_preserves_order(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=CountingEmbedder(), embed_batch_size=2, max_inflight=3
+        )
+        messages = [ChatMessage.from_user(f"Message {i}") for i in range(9)]
+        assert store.write_messages(messages) == 9
+        assert [doc.content for doc in document_store.filter_documents()] == [f"Message {i}" for i in range(9)]
+
+    def test_write_messages_reuses_executor(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), embed_batch_size=1)
+        store.write_messages([ChatMessage.from_user("Hello")])
+        # A single batch is embedded and written in the calling thread
+        assert store._executor is None
+
+        with store:
+            store.write_messages([ChatMessage.from_user("Hi"), ChatMessage.from_assistant("Hi!")])
+            executor = store._executor
+            store.write_messages([ChatMessage.from_user("Hey"), ChatMessage.from_assistant("Hey!")])
+            assert store._executor is executor is not None
+        assert store._executor is None
+
+    def test_write_messages_propagates_embedder_errors(self):
+        @component
+        class FailingEmbedder:
+            def warm_up(self):
+                pass
+
+            @component.output_types(documents=List[Document])
+            def run(self, documents: List[Document]):
+                raise RuntimeError("embedding failed")
+
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), FailingEmbedder())
+        with pytest.raises(RuntimeError, match="embedding failed"):
+            store.write_messages([ChatMessage.from_user("Hello")])
+
+    def test_write_messages_propagates_document_store_errors(self):
+        """
+        Test that a failing write is raised and stops embedding the remaining batches.
+        """
+        document_store = InMemoryDocumentStore()
+
+        def failing_write_documents(documents, *args, **kwargs):
+            raise IOError("write failed")
+
+        document_store.write_documents = failing_write_documents
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=embedder, embed_batch_size=1, max_inflight=1
+        )
+        with pytest.raises(IOError, match="write failed"):
+            store.write_messages([ChatMessage.from_user(f"Message {i}") for i in range(10)])
+        assert len(embedder.batches) < 10
+
+    def test_write_messages_meta(self):
+        """
+        Test that stored documents match `to_document` and that one call shares a single timestamp.
+        """
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store=document_store, document_embedder=CountingEmbedder())
+        message = ChatMessage.from_user("Hello", meta={"lang": "en"})
+        store.write_messages([message, ChatMessage.from_assistant("Hi!")])
+        documents = document_store.filter_documents()
+        expected = DistributedChatMessageStore.to_document(message)
+        assert documents[0].content == expected.content
+        assert documents[0].meta.keys() == expected.meta.keys()
+        assert documents[0].meta["role"] == "user"
+        assert documents[0].meta["lang"] == "en"
+        assert isinstance(documents[0].meta["timestamp"], int)
+        assert documents[0].meta["timestamp"] == documents[1].meta["timestamp"]
+        assert abs(documents[0].meta["timestamp"] - time.time()) < 60
+
+    def test_write_messages_buffered_by_threshold(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=CountingEmbedder(), flush_threshold_docs=3
+        )
+        assert store.write_messages([ChatMessage.from_user("1"), ChatMessage.from_user("2")]) == 2
+        assert document_store.count_documents() == 0
+        store.write_messages([ChatMessage.from_user("3")])
+        assert document_store.count_documents() == 3
+        store.write_messages([ChatMessage.from_user("4")])
+        assert document_store.count_documents() == 3
+        assert store.flush() == 1
+        assert document_store.count_documents() == 4
+        assert store.flush() == 0
+
+    def test_write_messages_buffered_by_interval(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=CountingEmbedder(), flush_interval_s=0.05
+        )
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert document_store.count_documents() == 0
+        deadline = time.monotonic() + 5
+        while document_store.count_documents() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert document_store.count_documents() == 1
+
+    def test_retrieve_waits_for_timer_flush_in_progress(self):
+        embedding_started, release_embedding = threading.Event(), threading.Event()
+
+        @component
+        class BlockingEmbedder:
+            def warm_up(self):
+                pass
+
+            @component.output_types(documents=List[Document])
+            def run(self, documents: List[Document]):
+                embedding_started.set()
+                release_embedding.wait(timeout=5)
+                return {"documents": documents}
+
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), BlockingEmbedder(), flush_interval_s=0.01)
+        store.write_messages([ChatMessage.from_user("m1")])
+        assert embedding_started.wait(timeout=5)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            retrieved = executor.submit(store.retrieve)
+            time.sleep(0.05)
+            assert not retrieved.done()
+            release_embedding.set()
+            assert [doc.content for doc in retrieved.result(timeout=5)] == ["m1"]
+
+    def test_context_manager_flushes_on_exit(self):
+        document_store = InMemoryDocumentStore()
+        with DistributedChatMessageStore(
+            document_store=document_store, document_embedder=CountingEmbedder(), flush_threshold_docs=100
+        ) as store:
+            store.write_messages([ChatMessage.from_user("Hello")])
+            assert document_store.count_documents() == 0
+        assert document_store.count_documents() == 1
+
+    def test_retrieve_flushes_buffer(self):
+        store = DistributedChatMessageStore(
+            document_store=InMemoryDocumentStore(), document_embedder=CountingEmbedder(), flush_threshold_docs=100
+        )
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert [doc.content for doc in store.retrieve()] == ["Hello"]
+
+    def test_embedding_cache(self):
+        """
+        Test that repeated contents are served from the embedding cache instead of being embedded again.
+        """
+        document_store = InMemoryDocumentStore()
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=embedder, embedding_cache_size=2
+        )
+        system_prompt = "You are helpful."
+        store.write_messages([ChatMessage.from_system(system_prompt, meta={"turn": 1}), ChatMessage.from_user("Hello")])
+        store.write_messages([ChatMessage.from_system(system_prompt, meta={"turn": 2}), ChatMessage.from_user("Hi")])
+        assert embedder.batches == [2, 1]
+        assert [doc.embedding for doc in document_store.filter_documents()] == [[16.0], [5.0], [16.0], [2.0]]
+
+        # "Hello" was evicted as the least recently used entry
+        store.write_messages([ChatMessage.from_user("Hello", meta={"turn": 3})])
+        assert embedder.batches == [2, 1, 1]
+
+    def test_embedding_cache_keyed_by_embedded_meta_fields(self):
+        document_store = InMemoryDocumentStore()
+        embedder = CountingEmbedder()
+        embedder.meta_fields_to_embed = ["role"]
+        store = DistributedChatMessageStore(
+            document_store=document_store, document_embedder=embedder, embedding_cache_size=10
+        )
+        store.write_messages([ChatMessage.from_user("Hello"), ChatMessage.from_assistant("Hello")])
+        store.write_messages([ChatMessage.from_user("Hello", meta={"turn": 2})])
+        assert embedder.batches == [2]
+
+        first, _, cached = document_store.filter_documents()
+        assert cached.embedding == first.embedding
+        assert cached.embedding is not first.embedding
+
+    def test_embedding_cache_disabled_by_default(self):
+        embedder = CountingEmbedder()
+        store = DistributedChatMessageStore(document_store=InMemoryDocumentStore(), document_embedder=embedder)
+        store.write_messages([ChatMessage.from_user("Hello", meta={"turn": 1})])
+        store.write_messages([ChatMessage.from_user("Hello", meta={"turn": 2})])
+        assert embedder.batches == [1, 1]
+
+    def test_retrieve_reuses_retriever(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), retrieve_cache_ttl=0)
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert [doc.content for doc in store.retrieve()] == ["Hello"]
+        retriever = store._retriever
+        store.retrieve()
+        assert store._retriever is retriever
+
+        # Replacing the document store drops the retriever bound to the old one
+        store.document_store = InMemoryDocumentStore()
+        assert store.retrieve() == []
+        assert store._retriever is not retriever
+
+    def test_write_messages_tags_user_id_from_filters(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(
+            document_store,
+            CountingEmbedder(),
+            filters={
+                "operator": "AND",
+                "conditions": [{"field": "meta.user_id", "operator": "==", "value": "alice"}],
+            },
+        )
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert document_store.filter_documents()[0].meta["user_id"] == "alice"
+
+        store.filters = {"field": "meta.user_id", "operator": "==", "value": "bob"}
+        store.write_messages([ChatMessage.from_user("Hi")])
+        assert [doc.content for doc in store.retrieve()] == ["Hi"]
+
+        store.filters = None
+        store.write_messages([ChatMessage.from_user("Hey")])
+        documents = document_store.filter_documents({"field": "content", "operator": "==", "value": "Hey"})
+        assert "user_id" not in documents[0].meta
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"operator": "NOT", "conditions": [{"field": "meta.user_id", "operator": "==", "value": "alice"}]},
+            {
+                "operator": "OR",
+                "conditions": [
+                    {"field": "meta.user_id", "operator": "==", "value": "alice"},
+                    {"field": "meta.user_id", "operator": "==", "value": "bob"},
+                ],
+            },
+        ],
+    )
+    def test_write_messages_ignores_user_id_under_not_and_or(self, filters):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder(), filters=filters)
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert "user_id" not in document_store.filter_documents()[0].meta
+        # Recent messages are not served from memory, so the result matches the document store
+        assert not store._recent_covers_filters
+        assert store.retrieve(last_n=1) == store.retrieve()[-1:]
+
+    def test_retrieve_cache(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder(), retrieve_cache_ttl=60)
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert [doc.content for doc in store.retrieve()] == ["Hello"]
+
+        # Writes through the document store directly are not visible until the cached result expires
+        document_store.write_documents([Document(content="Hi")])
+        assert [doc.content for doc in store.retrieve()] == ["Hello"]
+
+        # Writes through the store invalidate the cache
+        store.write_messages([ChatMessage.from_user("Hey")])
+        assert [doc.content for doc in store.retrieve()] == ["Hello", "Hi", "Hey"]
+
+    def test_retrieve_cache_disabled_by_default(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder())
+        assert store.retrieve() == []
+        document_store.write_documents([Document(content="Hi")])
+        assert [doc.content for doc in store.retrieve()] == ["Hi"]
+        assert not store._retr_cache
+
+    def test_retrieve_cache_evicts_expired_and_oldest_entries(self, monkeypatch):
+        monkeypatch.setattr(distributed, "_RETRIEVE_CACHE_SIZE", 2)
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder(), retrieve_cache_ttl=0.05)
+        for user_id in ["alice", "bob", "carol"]:
+            store.retrieve(filters={"field": "meta.user_id", "operator": "==", "value": user_id})
+        assert len(store._retr_cache) == 2
+
+        time.sleep(0.1)
+        store.retrieve(filters={"field": "meta.user_id", "operator": "==", "value": "dave"})
+        assert len(store._retr_cache) == 1
+
+    def test_delete_messages_keeps_documents(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder())
+        store.write_messages([ChatMessage.from_user("Hello"), ChatMessage.from_assistant("Hi!")])
+        store.delete_messages()
+        assert store.count_messages() == 0
+        assert document_store.count_documents() == 2
+
+    def test_no_instance_dict(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder())
+        assert not hasattr(store, "__dict__")
+
+    def test_retrieve_iter(self):
+        store = DistributedChatMessageStore(InMemoryDocumentStore(), CountingEmbedder())
+        store.write_messages([ChatMessage.from_user(f"Message {i}") for i in range(5)])
+        iterator = store.retrieve_iter(batch_size=2)
+        assert next(iterator).content == "Message 0"
+        assert [doc.content for doc in iterator] == [f"Message {i}" for i in range(1, 5)]
+
+    def test_retrieve_iter_streaming_document_store(self):
+        class StreamingDocumentStore(InMemoryDocumentStore):
+            def __init__(self):
+                super().__init__()
+                self.stream_calls = []
+
+            def filter_documents_stream(self, filters=None, batch_size=256):
+                self.stream_calls.append(batch_size)
+                yield from self.filter_documents(filters=filters)
+
+        document_store = StreamingDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder())
+        store.write_messages([ChatMessage.from_user("Hello")])
+        assert [doc.content for doc in store.retrieve_iter(batch_size=10)] == ["Hello"]
+        assert document_store.stream_calls == [10]
+
+    def test_retrieve_last_n(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(
+            document_store,
+            CountingEmbedder(),
+            filters={"field": "meta.user_id", "operator": "==", "value": "alice"},
+            recent_cache_size=2,
+        )
+        for i in range(3):
+            store.write_messages([ChatMessage.from_user(f"Message {i}")])
+
+        filter_documents = document_store.filter_documents
+        document_store.filter_documents = None  # served from memory, the document store must not be queried
+        assert [doc.content for doc in store.retrieve(last_n=2)] == ["Message 1", "Message 2"]
+        assert store.retrieve(last_n=0) == []
+
+        # More messages than kept in memory are read from the document store
+        document_store.filter_documents = filter_documents
+        assert [doc.content for doc in store.retrieve(last_n=3)] == ["Message 0", "Message 1", "Message 2"]
+        assert [doc.content for doc in store.retrieve(last_n=10)] == ["Message 0", "Message 1", "Message 2"]
+
+    def test_retrieve_last_n_after_filters_change_with_buffered_messages(self):
+        store = DistributedChatMessageStore(
+            InMemoryDocumentStore(),
+            CountingEmbedder(),
+            filters={"field": "meta.user_id", "operator": "==", "value": "alice"},
+            flush_threshold_docs=100,
+        )
+        store.write_messages([ChatMessage.from_user("alice secret")])
+        store.filters = {"field": "meta.user_id", "operator": "==", "value": "bob"}
+        # Flushing alice's buffered message must not make it part of bob's recent messages
+        assert store.retrieve(last_n=1) == []
+        assert store.retrieve() == []
+
+    def test_retrieve_last_n_other_filters_use_document_store(self):
+        document_store = InMemoryDocumentStore()
+        store = DistributedChatMessageStore(document_store, CountingEmbedder())
+        store.write_messages([ChatMessage.from_user("Hello"), ChatMessage.from_assistant("Hi!")])
+        # Without a user ID filter, messages written by others are part of the result
+        document_store.write_documents([Document(content="Hey", meta={"role": "user", "timestamp": int(time.time())})])
+        assert [doc.content for doc in store.retrieve(last_n=1)] == ["Hey"]
+        role_filter = {"field": "meta.role", "operator": "==", "value": "user"}
+        assert [doc.content for doc in store.retrieve(filters=role_filter, last_n=1)] == ["Hey"]
@@ -1,3 +1,4 @@
+import pytest
 from haystack.dataclasses import ChatMessage
 
 from haystack_experimental.chat_message_stores.in_memory import InMemoryChatMessageStore
@@ -84,3 +85,14 @@ class TestInMemoryChatMessageStore:
         assert store.count_messages() == 2
         store.delete_messages()
         assert store.count_messages() == 0
+
+    def test_write_messages_invalid_input(self):
+        """
+        Test that the InMemoryChatMessageStore rejects inputs that are not lists of ChatMessages.
+        """
+        store = InMemoryChatMessageStore()
+        with pytest.raises(ValueError):
+            store.write_messages([ChatMessage.from_user("Hello"), "not a chat message"])
+        with pytest.raises(ValueError):
+            store.write_messages(None)
+        assert store.count_messages() == 0
@@ -8,6 +8,7 @@ from typing import Iterator
 import logging
 import os
 import json
+import math
 from datetime import datetime
 
 from openai import OpenAIError
@@ -35,6 +36,8 @@ from haystack.tools import Tool
 from haystack_experimental.components.generators.chat.openai import (
     OpenAIChatGenerator,
     _convert_message_to_openai_format,
+    _parse_tool_call_arguments,
+    orjson_import,
 )
 
 
@@ -718,6 +721,22 @@ class TestOpenAIChatGenerator:
             "tool_call_id": "123",
         }
 
+    def test_convert_message_to_openai_format_keeps_non_ascii_arguments(self):
+        message = ChatMessage.from_assistant(
+            tool_calls=[ToolCall(id="123", tool_name="weather", arguments={"city": "Zürich ☀️"})]
+        )
+        openai_msg = _convert_message_to_openai_format(message)
+        assert openai_msg["tool_calls"][0]["function"]["arguments"] == '{"city": "Zürich ☀️"}'
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_parse_tool_call_arguments(self, monkeypatch, orjson_available):
+        monkeypatch.setattr(orjson_import, "is_successful", lambda: orjson_available)
+        assert _parse_tool_call_arguments('{"city": "Zürich", "days": [1, 2]}') == {"city": "Zürich", "days": [1, 2]}
+        # orjson rejects NaN, the standard library accepts it
+        assert math.isnan(_parse_tool_call_arguments('{"value": NaN}')["value"])
+        with pytest.raises(json.JSONDecodeError):
+            _parse_tool_call_arguments('{"city": ')
+
     def test_convert_message_to_openai_invalid(self):
         message = ChatMessage(_role=ChatRole.ASSISTANT, _content=[])
         with pytest.raises(ValueError):
@@ -1,6 +1,20 @@
 import asyncio
+import contextvars
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from haystack import component, tracing
 
 from haystack_experimental import AsyncPipeline
+from haystack_experimental.core.pipeline import async_pipeline
+from haystack_experimental.core.pipeline.async_pipeline import (
+    _create_eager_task,
+    _run_in_new_event_loop,
+    _run_in_thread_event_loop,
+)
 
 
 def test_async_pipeline_reentrance(waiting_component, spying_tracer):
@@ -28,3 +42,265 @@ def test_async_pipeline_reentrance(waiting_component, spying_tracer):
     finally:
         async_loop.close()
 
+
+
+def test_async_pipeline_content_tracing(waiting_component, spying_tracer):
+    pp = AsyncPipeline()
+    pp.add_component("wait", waiting_component())
+
+    pp.run({"wait_for": 0})
+    span = next(sp for sp in spying_tracer.spans if sp.operation_name == "haystack.component.run_async")
+    assert "haystack.component.input" not in span.tags
+
+    spying_tracer.spans.clear()
+    tracing.tracer.is_content_tracing_enabled = True
+    try:
+        pp.run({"wait_for": 0})
+    finally:
+        tracing.tracer.is_content_tracing_enabled = False
+    span = next(sp for sp in spying_tracer.spans if sp.operation_name == "haystack.component.run_async")
+    assert span.tags["haystack.component.input"] == {"wait_for": 0}
+    assert span.tags["haystack.component.outputs"] == {"waited_for": 0}
+
+
+def test_run_in_new_event_loop_uses_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+
+    async def loop_type():
+        return type(asyncio.get_running_loop())
+
+    assert _run_in_new_event_loop(loop_type()) is uvloop.Loop
+
+
+def test_run_in_new_event_loop_without_uvloop(monkeypatch):
+    monkeypatch.setattr(async_pipeline.uvloop_import, "is_successful", lambda: False)
+
+    async def loop_type():
+        return type(asyncio.get_running_loop())
+
+    assert issubclass(_run_in_new_event_loop(loop_type()), asyncio.BaseEventLoop)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="Eager tasks require Python 3.12+")
+def test_create_eager_task_runs_until_first_suspension():
+    async def immediate():
+        return 42
+
+    async def main():
+        task = _create_eager_task(immediate())
+        assert task.done()
+        return await task
+
+    assert asyncio.run(main()) == 42
+
+
+def test_async_pipeline_with_components_that_complete_without_suspending():
+    @component
+    class Incrementer:
+        @component.output_types(value=int)
+        def run(self, value: int):
+            return {"value": value + 1}
+
+        @component.output_types(value=int)
+        async def run_async(self, value: int):
+            return {"value": value + 1}
+
+    pp = AsyncPipeline()
+    pp.add_component("first", Incrementer())
+    pp.add_component("second", Incrementer())
+    pp.connect("first.value", "second.value")
+    assert pp.run({"first": {"value": 1}}) == {"second": {"value": 3}}
+
+
+def test_async_pipeline_component_spec_tags_follow_connections(waiting_component, spying_tracer):
+    pp = AsyncPipeline()
+    pp.add_component("wait", waiting_component())
+    pp.run({"wait_for": 0})
+    span = next(sp for sp in spying_tracer.spans if sp.operation_name == "haystack.component.run_async")
+    assert span.tags["haystack.component.input_spec"] == {"wait_for": {"type": "int", "senders": []}}
+    assert span.tags["haystack.component.output_spec"] == {"waited_for": {"type": "int", "receivers": []}}
+
+    spying_tracer.spans.clear()
+    pp.add_component("wait_again", waiting_component())
+    pp.connect("wait.waited_for", "wait_again.wait_for")
+    pp.run({"wait": {"wait_for": 0}})
+    spans = {
+        sp.tags["haystack.component.name"]: sp
+        for sp in spying_tracer.spans
+        if sp.operation_name == "haystack.component.run_async"
+    }
+    assert spans["wait"].tags["haystack.component.output_spec"] == {
+        "waited_for": {"type": "int", "receivers": ["wait_again"]}
+    }
+    assert spans["wait_again"].tags["haystack.component.input_spec"] == {
+        "wait_for": {"type": "int", "senders": ["wait"]}
+    }
+
+
+def test_async_pipeline_runs_sync_components_on_scoped_executor():
+    @component
+    class ThreadNameRecorder:
+        @component.output_types(thread_name=str)
+        def run(self, value: int):
+            return {"thread_name": threading.current_thread().name}
+
+    pp = AsyncPipeline()
+    pp.add_component("recorder", ThreadNameRecorder())
+    threads_before = threading.active_count()
+    result = pp.run({"recorder": {"value": 1}}, concurrency_limit=1)
+    assert result["recorder"]["thread_name"].startswith("haystack-sync")
+
+    # The executor is shut down when the run finishes, so its worker thread goes away
+    for _ in range(100):
+        if threading.active_count() <= threads_before:
+            break
+        time.sleep(0.01)
+    assert threading.active_count() <= threads_before
+
+
+def test_async_pipeline_skips_spec_tags_when_tracing_is_disabled(waiting_component, monkeypatch):
+    assert not tracing.is_tracing_enabled()
+    pp = AsyncPipeline()
+    pp.add_component("wait", waiting_component())
+
+    def _fail(component_name):
+        raise AssertionError("spec tags should not be built without a tracer")
+
+    monkeypatch.setattr(pp, "_get_component_spec_tags", _fail)
+    assert pp.run({"wait_for": 0}) == {"wait": {"waited_for": 0}}
+
+
+def test_async_pipeline_runs_components_inline_with_concurrency_limit_one(waiting_component, monkeypatch):
+    def _fail(coro):
+        coro.close()
+        raise AssertionError("no tasks should be created when components run one at a time")
+
+    monkeypatch.setattr(async_pipeline, "_create_eager_task", _fail)
+    pp = AsyncPipeline()
+    pp.add_component("first", waiting_component())
+    pp.add_component("second", waiting_component())
+    pp.connect("first.waited_for", "second.wait_for")
+
+    async def collect():
+        return [
+            partial
+            async for partial in pp.run_async_generator({"first": {"wait_for": 0}}, concurrency_limit=1)
+        ]
+
+    assert asyncio.run(collect()) == [{"second": {"waited_for": 0}}, {"second": {"waited_for": 0}}]
+
+
+@pytest.mark.parametrize("deep_copy_outputs", [True, False])
+def test_async_pipeline_generator_deep_copy_outputs(deep_copy_outputs):
+    @component
+    class ListProducer:
+        @component.output_types(values=list)
+        def run(self, value: int):
+            return {"values": [value]}
+
+    pp = AsyncPipeline()
+    pp.add_component("producer", ListProducer())
+
+    async def collect():
+        return [
+            partial
+            async for partial in pp.run_async_generator(
+                {"producer": {"value": 1}}, include_outputs_from={"producer"}, deep_copy_outputs=deep_copy_outputs
+            )
+        ]
+
+    partial, final = asyncio.run(collect())
+    partial["producer"]["values"].append(2)
+    assert final["producer"]["values"] == ([1] if deep_copy_outputs else [1, 2])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Reusing the event loop requires Python 3.11+")
+def test_run_in_thread_event_loop_reuses_loop_of_main_thread():
+    var = contextvars.ContextVar("var", default=0)
+
+    async def get_loop_and_bump_var():
+        var.set(var.get() + 1)
+        return asyncio.get_running_loop(), var.get()
+
+    first_loop, first_value = _run_in_thread_event_loop(get_loop_and_bump_var())
+    second_loop, second_value = _run_in_thread_event_loop(get_loop_and_bump_var())
+    assert first_loop is second_loop
+    assert first_value == second_value == 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_loop, _ = executor.submit(_run_in_thread_event_loop, get_loop_and_bump_var()).result()
+        other_loop_again, _ = executor.submit(_run_in_thread_event_loop, get_loop_and_bump_var()).result()
+    assert other_loop is not first_loop
+    # Other threads get a new event loop for every call, which is closed afterwards
+    assert other_loop is not other_loop_again
+    assert other_loop.is_closed()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="Reusing the event loop requires Python 3.11+")
+def test_async_pipeline_cancels_running_components_when_a_component_fails():
+    finished = []
+
+    @component
+    class Failing:
+        @component.output_types(value=int)
+        def run(self, value: int):
+            raise ValueError("boom")
+
+        @component.output_types(value=int)
+        async def run_async(self, value: int):
+            raise ValueError("boom")
+
+    @component
+    class Slow:
+        @component.output_types(value=int)
+        def run(self, value: int):
+            return {"value": value}
+
+        @component.output_types(value=int)
+        async def run_async(self, value: int):
+            await asyncio.sleep(0.1)
+            finished.append(value)
+            return {"value": value}
+
+    pp = AsyncPipeline()
+    pp.add_component("failing", Failing())
+    pp.add_component("slow", Slow())
+
+    with pytest.raises(ValueError, match="boom"):
+        pp.run({"failing": {"value": 1}, "slow": {"value": 1}})
+    # The next call reuses the event loop, which must not resume the component of the failed run
+    _run_in_thread_event_loop(asyncio.sleep(0.2))
+    assert finished == []
+
+
+def test_async_pipeline_nested_runs_close_their_event_loops():
+    inner_loops = []
+
+    @component
+    class LoopRecorder:
+        @component.output_types(value=int)
+        def run(self, value: int):
+            return {"value": value}
+
+        @component.output_types(value=int)
+        async def run_async(self, value: int):
+            inner_loops.append(asyncio.get_running_loop())
+            return {"value": value}
+
+    inner = AsyncPipeline()
+    inner.add_component("recorder", LoopRecorder())
+
+    @component
+    class NestedPipeline:
+        @component.output_types(value=int)
+        def run(self, value: int):
+            # Sync components run on executor threads, which are created anew for every outer run
+            return {"value": inner.run({"recorder": {"value": value}})["recorder"]["value"]}
+
+    outer = AsyncPipeline()
+    outer.add_component("nested", NestedPipeline())
+
+    for i in range(5):
+        assert outer.run({"nested": {"value": i}}) == {"nested": {"value": i}}
+    assert len(inner_loops) == 5
+    assert all(loop.is_closed() for loop in inner_loops)
@@ -31,4 +31,21 @@ def test_pipeline_thread_safety(waiting_component, spying_tracer):
     ]
 
     for span in component_spans:
-        assert span.tags["haystack.component.visits"] == 1
\ No newline at end of file
+        assert span.tags["haystack.component.visits"] == 1
+
+
+def test_ordered_names_and_receivers_are_cached_until_graph_changes(waiting_component):
+    pp = Pipeline()
+    pp.add_component("b", waiting_component())
+    pp.add_component("a", waiting_component())
+    names, receivers = pp._get_ordered_names_and_receivers()
+    assert names == ["a", "b"]
+    assert receivers == {"a": [], "b": []}
+    assert pp._get_ordered_names_and_receivers()[0] is names
+
+    pp.connect("a.waited_for", "b.wait_for")
+    names, receivers = pp._get_ordered_names_and_receivers()
+    assert [receiver for receiver, _, _ in receivers["a"]] == ["b"]
+
+    pp.remove_component("b")
+    assert pp._get_ordered_names_and_receivers() == (["a"], {"a": []})